@@ -1,4 +1,4 @@
-from .client import LemonadeClient
+from .client import LemonadeClient, AsyncLemonadeClient
 from .model_discovery import discover_lemonade_models, discover_lemonade_models_with_info
 from .model_info import ModelInfo, LABEL_VISION, LABEL_REASONING, LABEL_CODING, LABEL_TOOL_CALLING, LABEL_EMBEDDINGS, LABEL_RERANKING, LABEL_IMAGE, LABEL_HOT, LABEL_CUSTOM
 from .port_scanner import find_available_lemonade_port
@@ -7,6 +7,7 @@ from .audio_stream import WhisperWebSocketClient
 
 __all__ = [
     'LemonadeClient',
+    'AsyncLemonadeClient',
     'discover_lemonade_models',
     'discover_lemonade_models_with_info',
     'find_available_lemonade_port',
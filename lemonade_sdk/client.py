@@ -2,10 +2,11 @@
 LemonadeClient - Main class for interacting with the Lemonade server
 """
 
+import asyncio
 import requests
 import json
-from typing import Dict, List, Optional, Any
-from .request_builder import build_chat_completion_payload, send_request, build_embedding_payload, build_transcription_payload, send_multipart_request, build_speech_payload, build_reranking_payload, build_image_generation_payload
+from typing import Dict, Iterator, List, Optional, Any, Union
+from .request_builder import httpx, create_session, create_httpx_client, open_stream, HTTPX_AVAILABLE, HTTP2_AVAILABLE, HTTP_ERRORS, REQUEST_ERRORS, encode_json, parse_json_response, build_chat_completion_payload, send_request, send_stream_request, build_embedding_payload, build_transcription_payload, send_multipart_request, build_speech_payload, build_reranking_payload, build_image_generation_payload
 from .model_discovery import get_active_model
 from .model_info import ModelInfo
 from .audio_stream import WhisperWebSocketClient
@@ -16,15 +17,24 @@ class LemonadeClient:
     A class for interacting with the Lemonade LLM Server.
     """
 
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    __slots__ = ("base_url", "session")
+
+    def __init__(self, base_url: str = "http://localhost:8000", use_httpx: bool = False):
         """
         Initializes the Lemonade Client with the base URL.
 
         Args:
             base_url (str): The base URL of the Lemonade server (default: http://localhost:8000)
+            use_httpx (bool): Use an httpx client (HTTP/2 capable) instead of requests.
+                Falls back to requests if httpx is not installed (default: False)
         """
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
+
+        if use_httpx and not HTTPX_AVAILABLE:
+            print("httpx not installed, falling back to requests. Run: pip install httpx[http2]")
+            use_httpx = False
+
+        self.session = create_httpx_client(self.base_url) if use_httpx else create_session()
         
     def list_models(self) -> List[Dict[str, Any]]:
         """
@@ -37,12 +47,12 @@ class LemonadeClient:
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json_response(response)
 
             # Lemonade returns models under 'data' key
             models = data.get('data', [])
             return models
-        except requests.exceptions.RequestException as e:
+        except REQUEST_ERRORS as e:
             print(f"Error retrieving models: {e}")
             return []
         except json.JSONDecodeError as e:
@@ -63,7 +73,7 @@ class LemonadeClient:
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json_response(response)
             models = data.get('data', [])
 
             for model in models:
@@ -72,7 +82,7 @@ class LemonadeClient:
                     return ModelInfo.from_api_response(model)
 
             return None
-        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+        except REQUEST_ERRORS + (json.JSONDecodeError,) as e:
             print(f"Error retrieving model info for {model_id}: {e}")
             return None
 
@@ -130,7 +140,7 @@ class LemonadeClient:
         info = self.get_model_info(model_id)
         return info.get_capabilities_summary() if info else "Model not found"
     
-    def chat_completion(self, model: str, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+    def chat_completion(self, model: str, messages: List[Dict[str, str]], **kwargs) -> Union[Dict[str, Any], Iterator[Dict[str, Any]]]:
         """
         Sends a chat completion request to the Lemonade server.
 
@@ -139,15 +149,20 @@ class LemonadeClient:
             messages (List[Dict[str, str]]): The messages for the conversation
             **kwargs: Additional parameters for the request
                 timeout (int): Request timeout in seconds (default: 30, use 120+ for vision)
+                stream (bool): If True, return an iterator over the streamed chunks
 
         Returns:
-            Dict[str, Any]: The response from the server
+            Union[Dict[str, Any], Iterator[Dict[str, Any]]]: The response from the server,
+                or an iterator of response chunks if stream=True
         """
         url = f"{self.base_url}/api/v1/chat/completions"
 
         timeout = kwargs.pop('timeout', 30)
         payload = build_chat_completion_payload(model, messages, **kwargs)
 
+        if payload["stream"]:
+            return send_stream_request(url, payload, session=self.session, timeout=timeout)
+
         try:
             response = send_request(url, payload, session=self.session, timeout=timeout)
             return response
@@ -164,8 +179,9 @@ class LemonadeClient:
         """
         try:
             url = f"{self.base_url}/api/v1/health"
-            response = self.session.get(url, timeout=10)
-            return response.status_code == 200
+            # Only the status code matters, so don't download or decode the body
+            with open_stream(self.session, "GET", url, timeout=10) as response:
+                return response.status_code == 200
         except Exception:
             return False
 
@@ -180,8 +196,8 @@ class LemonadeClient:
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return parse_json_response(response)
+        except REQUEST_ERRORS as e:
             print(f"Error retrieving stats: {e}")
             return {}
         except json.JSONDecodeError as e:
@@ -195,7 +211,7 @@ class LemonadeClient:
         Returns:
             Optional[str]: The name of the current model or None
         """
-        return get_active_model(self.base_url)
+        return get_active_model(self.base_url, session=self.session)
     
     def load_model(self, model_name: str, **kwargs) -> Dict[str, Any]:
         """
@@ -380,12 +396,12 @@ class LemonadeClient:
             else:
                 return response.content
 
-        except requests.exceptions.HTTPError as e:
+        except HTTP_ERRORS as e:
             print(f"HTTP error in TTS request: {e}")
             if response is not None:
                 print(f"Response body: {response.text}")
             return {"error": f"HTTP Error: {e}"}
-        except requests.exceptions.RequestException as e:
+        except REQUEST_ERRORS as e:
             print(f"Error in TTS request: {e}")
             return {"error": f"Request Error: {e}"}
 
@@ -516,7 +532,7 @@ class LemonadeClient:
             response = self.session.post(url, json=payload, timeout=120)
             response.raise_for_status()
 
-            data = response.json()
+            data = parse_json_response(response)
 
             # Extract image data
             if response_format == "b64_json":
@@ -545,14 +561,125 @@ class LemonadeClient:
                     return None
                 return data
 
-        except requests.exceptions.HTTPError as e:
+        except HTTP_ERRORS as e:
             print(f"HTTP error in image generation: {e}")
             if response is not None:
                 print(f"Response body: {response.text}")
             return {"error": f"HTTP Error: {e}"}
-        except requests.exceptions.RequestException as e:
+        except REQUEST_ERRORS as e:
             print(f"Error in image generation: {e}")
             return {"error": f"Request Error: {e}"}
         except Exception as e:
             print(f"Error processing image response: {e}")
-            return {"error": str(e)}
\ No newline at end of file
+            return {"error": str(e)}
+
+
+class AsyncLemonadeClient:
+    """
+    An asyncio client for sending many chat completions to the Lemonade server in parallel.
+
+    Requires httpx: pip install httpx
+
+    Example:
+        ```python
+        async with AsyncLemonadeClient(concurrency=8) as client:
+            results = await client.abatch_chat_completion([
+                {"model": "Llama-3-8B-Instruct", "messages": [{"role": "user", "content": "Hi"}]},
+                {"model": "Qwen3-8B", "messages": [{"role": "user", "content": "Hi"}]},
+            ])
+        ```
+    """
+
+    __slots__ = ("base_url", "concurrency", "session")
+
+    # Upper bound for requests in flight against a single server
+    MAX_CONCURRENCY = 64
+
+    def __init__(self, base_url: str = "http://localhost:8000", concurrency: int = 16):
+        """
+        Initializes the async Lemonade Client with the base URL.
+
+        Args:
+            base_url (str): The base URL of the Lemonade server (default: http://localhost:8000)
+            concurrency (int): Maximum number of requests in flight (default: 16, capped at 64)
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("AsyncLemonadeClient requires httpx. Run: pip install httpx")
+
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = max(1, min(concurrency, self.MAX_CONCURRENCY))
+        self.session = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=HTTP2_AVAILABLE,
+            timeout=30,
+            limits=httpx.Limits(max_connections=self.MAX_CONCURRENCY, max_keepalive_connections=self.concurrency),
+        )
+
+    async def __aenter__(self) -> "AsyncLemonadeClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the underlying connection pool."""
+        await self.session.aclose()
+
+    async def achat_completion(self, model: str, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        """
+        Sends a single (non-streaming) chat completion request to the Lemonade server.
+
+        Args:
+            model (str): The name of the model to use
+            messages (List[Dict[str, str]]): The messages for the conversation
+            **kwargs: Additional parameters for the request
+                timeout (int): Request timeout in seconds (default: 30, use 120+ for vision)
+
+        Returns:
+            Dict[str, Any]: The response from the server
+        """
+        url = f"{self.base_url}/api/v1/chat/completions"
+
+        timeout = kwargs.pop('timeout', 30)
+        kwargs.pop('stream', None)
+        payload = build_chat_completion_payload(model, messages, **kwargs)
+
+        response = None
+        try:
+            response = await self.session.post(
+                url, content=encode_json(payload), headers={"Content-Type": "application/json"}, timeout=timeout
+            )
+            response.raise_for_status()
+            return parse_json_response(response)
+        except httpx.HTTPStatusError as e:
+            print(f"HTTP error in request to {url}: {e}")
+            if response is not None:
+                print(f"Response body: {response.text}")
+            return {"error": f"HTTP Error: {e}"}
+        except httpx.HTTPError as e:
+            print(f"Error in request to {url}: {e}")
+            return {"error": f"Request Error: {e}"}
+        except json.JSONDecodeError as e:
+            print(f"Error parsing response from {url}: {e}")
+            return {"error": f"JSON Decode Error: {e}"}
+
+    async def abatch_chat_completion(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Sends several chat completion requests concurrently.
+
+        At most `concurrency` requests are in flight at the same time.
+
+        Args:
+            requests (List[Dict[str, Any]]): One dict per request with "model", "messages"
+                and optionally any further achat_completion() parameters
+
+        Returns:
+            List[Dict[str, Any]]: The responses, in the same order as the requests
+        """
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def _one(request: Dict[str, Any]) -> Dict[str, Any]:
+            async with sem:
+                return await self.achat_completion(**request)
+
+        return list(await asyncio.gather(*[_one(dict(request)) for request in requests]))
@@ -2,28 +2,84 @@
 Module for discovering and managing Lemonade models
 """
 
+import re
+import threading
+import time
 import requests
 import json
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import List, Dict, Any, Optional, Tuple
 from .port_scanner import find_available_lemonade_port
+from .request_builder import get_default_session, parse_json_response, REQUEST_ERRORS
 from .model_info import ModelInfo
 
+# Matches the port of a base URL such as http://localhost:8000
+_PORT_RE = re.compile(r':(\d+)')
 
-def discover_lemonade_models(base_url: str = "http://localhost:8000") -> List[Dict[str, Any]]:
+# Short-lived cache of the raw /api/v1/models data, keyed by base URL
+_CACHE_TTL = 2.0
+_CACHE: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _format_model(model: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Scans for available models on the Lemonade server.
+    Converts a raw model entry from /api/v1/models into the discovery format.
+
+    Args:
+        model (Dict[str, Any]): The model as returned by the Lemonade API
+
+    Returns:
+        Dict[str, Any]: The formatted model
+    """
+    # Resolve the display name once instead of nesting .get() defaults
+    name_or_id = model.get('name') or model.get('id') or 'unknown'
+
+    return {
+        'id': model.get('id', name_or_id),
+        'name': model.get('name', name_or_id),
+        'object': model.get('object', 'model'),
+        'created': model.get('created', 0),
+        'owned_by': model.get('owned_by', 'unknown'),
+        'source': 'external',
+        'provider': 'Lemonade',
+        'status': 'Available',
+        'size_gb': 0,  # Lemonade doesn't provide size info in the API
+        'local_path': f"lemonade://{name_or_id}",
+        'backend': 'lemonade',
+        # New: label and capability metadata
+        'labels': model.get('labels', []),
+        'recipe': model.get('recipe', ''),
+        'mmproj': model.get('mmproj'),
+    }
+
+
+def _fetch_raw_models(base_url: str = "http://localhost:8000", session: Optional[requests.Session] = None, force: bool = False) -> List[Dict[str, Any]]:
+    """
+    Retrieves the unformatted model entries from the Lemonade server.
+
+    Results are cached per base URL for a short time (2 seconds), so repeated
+    lookups in quick succession don't hit the server again.
 
     Args:
         base_url (str): The base URL of the Lemonade server
+        session (Optional[requests.Session]): Optional session (default: shared module session)
+        force (bool): Bypass the cache and always query the server (default: False)
 
     Returns:
-        List[Dict[str, Any]]: List of found models with their properties
+        List[Dict[str, Any]]: The models as returned by the Lemonade API
     """
+    cache_key = base_url
+    if not force:
+        with _CACHE_LOCK:
+            cached = _CACHE.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _CACHE_TTL:
+            return cached[1]
+
     # Try to find the correct port if the default port is not available
     if "localhost" in base_url or "127.0.0.1" in base_url:
         # Extract port from URL
-        import re
-        port_match = re.search(r':(\d+)', base_url)
+        port_match = _PORT_RE.search(base_url)
         if port_match:
             current_port = int(port_match.group(1))
             available_port = find_available_lemonade_port(ports=[current_port])
@@ -32,39 +88,21 @@ def discover_lemonade_models(base_url: str = "http://localhost:8000") -> List[Di
                 base_url = base_url.replace(f':{current_port}', f':{available_port}')
     
     url = f"{base_url}/api/v1/models"
+    s = session or get_default_session()
     
     try:
-        response = requests.get(url, timeout=10)
+        response = s.get(url, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = parse_json_response(response)
         
         # Lemonade returns models under 'data' key
         models = data.get('data', [])
-        
-        # Format the models to match the expected structure
-        formatted_models = []
-        for model in models:
-            formatted_model = {
-                'id': model.get('id', model.get('name', 'unknown')),
-                'name': model.get('name', model.get('id', 'unknown')),
-                'object': model.get('object', 'model'),
-                'created': model.get('created', 0),
-                'owned_by': model.get('owned_by', 'unknown'),
-                'source': 'external',
-                'provider': 'Lemonade',
-                'status': 'Available',
-                'size_gb': 0,  # Lemonade doesn't provide size info in the API
-                'local_path': f"lemonade://{model.get('name', model.get('id', 'unknown'))}",
-                'backend': 'lemonade',
-                # New: label and capability metadata
-                'labels': model.get('labels', []),
-                'recipe': model.get('recipe', ''),
-                'mmproj': model.get('mmproj'),
-            }
-            formatted_models.append(formatted_model)
-        
-        return formatted_models
-    except requests.exceptions.RequestException as e:
+
+        with _CACHE_LOCK:
+            _CACHE[cache_key] = (time.monotonic(), models)
+
+        return models
+    except REQUEST_ERRORS as e:
         print(f"Error retrieving models from {base_url}: {e}")
         return []
     except json.JSONDecodeError as e:
@@ -72,71 +110,122 @@ def discover_lemonade_models(base_url: str = "http://localhost:8000") -> List[Di
         return []
 
 
-def get_active_model(base_url: str = "http://localhost:8000") -> Optional[str]:
+def discover_lemonade_models(base_url: str = "http://localhost:8000", session: Optional[requests.Session] = None, force: bool = False) -> List[Dict[str, Any]]:
+    """
+    Scans for available models on the Lemonade server.
+
+    Results are cached per base URL for a short time (2 seconds), so repeated
+    lookups in quick succession don't hit the server again.
+
+    Args:
+        base_url (str): The base URL of the Lemonade server
+        session (Optional[requests.Session]): Optional session (default: shared module session)
+        force (bool): Bypass the cache and always query the server (default: False)
+
+    Returns:
+        List[Dict[str, Any]]: List of found models with their properties
+    """
+    models = _fetch_raw_models(base_url, session=session, force=force)
+
+    # Format the models to match the expected structure
+    return [_format_model(model) for model in models]
+
+
+def get_active_model(base_url: str = "http://localhost:8000", session: Optional[requests.Session] = None) -> Optional[str]:
     """
     Retrieves the currently active model from the Lemonade server.
 
     Args:
         base_url (str): The base URL of the Lemonade server
+        session (Optional[requests.Session]): Optional session (default: shared module session)
 
     Returns:
         Optional[str]: The name of the active model or None
     """
     # Lemonade has no direct endpoint for the active model,
     # so we try various known endpoints
+    s = session or get_default_session()
     endpoints_to_try = [
         f"{base_url}/api/v1/current_model",
         f"{base_url}/api/v1/model",
         f"{base_url}/api/v1/status"
     ]
 
-    for endpoint in endpoints_to_try:
-        try:
-            response = requests.get(endpoint, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
+    # Query all endpoints at once, but keep their priority order
+    executor = ThreadPoolExecutor(max_workers=len(endpoints_to_try))
+    futures = [executor.submit(_fetch_active_model, s, endpoint) for endpoint in endpoints_to_try]
+    deadline = time.monotonic() + 5
 
-                # Try various possible field names for the active model
-                for field in ['model', 'current_model', 'active_model', 'name']:
-                    if field in data:
-                        return data[field]
-
-                # If the result is directly a string
-                if isinstance(data, str):
-                    return data
-
-        except (requests.exceptions.RequestException, json.JSONDecodeError):
-            continue
+    try:
+        for future in futures:
+            try:
+                active_model = future.result(timeout=max(0, deadline - time.monotonic()))
+            except (FuturesTimeoutError,) + REQUEST_ERRORS + (json.JSONDecodeError,):
+                continue
+            if active_model:
+                return active_model
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
 
     # As a fallback, try to get the first available model
-    available_models = discover_lemonade_models(base_url)
+    available_models = discover_lemonade_models(base_url, session=s)
     if available_models:
         return available_models[0]['name']
 
     return None
 
 
-def verify_model_availability(model_name: str, base_url: str = "http://localhost:8000") -> bool:
+def _fetch_active_model(session: requests.Session, endpoint: str) -> Optional[str]:
+    """
+    Reads the active model name from a single status endpoint.
+
+    Args:
+        session (requests.Session): The session to use for the request
+        endpoint (str): The endpoint URL to query
+
+    Returns:
+        Optional[str]: The name of the active model or None
+    """
+    response = session.get(endpoint, timeout=5)
+    if response.status_code != 200:
+        return None
+
+    data = parse_json_response(response)
+
+    # If the result is directly a string
+    if isinstance(data, str):
+        return data
+
+    # Try various possible field names for the active model
+    if isinstance(data, dict):
+        for field in ['model', 'current_model', 'active_model', 'name']:
+            if field in data:
+                return data[field]
+
+    return None
+
+
+def verify_model_availability(model_name: str, base_url: str = "http://localhost:8000", session: Optional[requests.Session] = None) -> bool:
     """
     Checks if a specific model is available on the Lemonade server.
 
     Args:
         model_name (str): The name of the model to check
         base_url (str): The base URL of the Lemonade server
+        session (Optional[requests.Session]): Optional session (default: shared module session)
 
     Returns:
         bool: True if the model is available, otherwise False
     """
-    available_models = discover_lemonade_models(base_url)
-
-    for model in available_models:
-        if model['name'] == model_name or model['id'] == model_name:
-            return True
+    models = _fetch_raw_models(base_url, session=session)
 
-    return False
+    names = {model.get('id') for model in models} | {model.get('name') for model in models}
+    return model_name in names
 
 
-def discover_lemonade_models_with_info(base_url: str = "http://localhost:8000") -> List[ModelInfo]:
+def discover_lemonade_models_with_info(base_url: str = "http://localhost:8000", session: Optional[requests.Session] = None) -> List[ModelInfo]:
     """
     Scans for available models on the Lemonade server and returns ModelInfo objects.
 
@@ -145,11 +234,12 @@ def discover_lemonade_models_with_info(base_url: str = "http://localhost:8000")
 
     Args:
         base_url (str): The base URL of the Lemonade server
+        session (Optional[requests.Session]): Optional session (default: shared module session)
 
     Returns:
         List[ModelInfo]: List of found models as ModelInfo objects
     """
-    raw_models = discover_lemonade_models(base_url)
+    raw_models = discover_lemonade_models(base_url, session=session)
 
     # Extract raw model data from the formatted dicts
     model_infos = []
@@ -2,15 +2,47 @@
 Module for scanning available Lemonade servers
 """
 
+import asyncio
+import errno
+import functools
+import selectors
 import socket
+import time
 import requests
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+from .request_builder import get_default_session, parse_json_response
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    aiohttp = None
 
 # Default ports for Lemonade server discovery
 # Lemonade typically runs on every 20th port in the 8000-9000 range
 LEMONADE_DEFAULT_PORTS = [8000, 8020, 8040, 8060, 8080, 9000, 13305, 11434]  # Standard ports + new defaults (13305, 11434)
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve(host: str) -> Tuple[Tuple[int, str], ...]:
+    """
+    Resolves a host name once and caches the result for later port checks.
+
+    Args:
+        host (str): The host name or address to resolve
+
+    Returns:
+        Tuple[Tuple[int, str], ...]: (address family, numeric address) pairs in resolver order
+    """
+    addresses = []
+    for family, _, _, _, sockaddr in socket.getaddrinfo(host, None, type=socket.SOCK_STREAM):
+        if (family, sockaddr[0]) not in addresses:
+            addresses.append((family, sockaddr[0]))
+    return tuple(addresses)
+
+
 def is_port_open(host: str, port: int, timeout: float = 0.5) -> bool:
     """
     Checks if a TCP port is reachable on the host.
@@ -24,13 +56,98 @@ def is_port_open(host: str, port: int, timeout: float = 0.5) -> bool:
         bool: True if the port is reachable, otherwise False
     """
     try:
-        with socket.create_connection((host, port), timeout=timeout):
-            return True
+        addresses = _resolve(host)
     except Exception:
         return False
 
+    # Like socket.create_connection(), try every resolved address
+    # (e.g. ::1 and 127.0.0.1 for localhost), but without a DNS lookup per call
+    for family, address in addresses:
+        sock = None
+        try:
+            # Inside the try: the family may be unsupported (e.g. IPv6 disabled)
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            sock.connect((address, port))
+            return True
+        except Exception:
+            continue
+        finally:
+            if sock is not None:
+                sock.close()
+
+    return False
+
 
-def verify_lemonade_server(port: int, host: str = "127.0.0.1") -> bool:
+def scan_ports(host: str, ports: List[int], timeout: float = 0.5) -> List[int]:
+    """
+    Checks many TCP ports on a host at once.
+
+    Starts a non-blocking connect for every port and waits for all of them
+    together with a selector, instead of one blocking connect per port.
+
+    Args:
+        host (str): The host on which to check the ports
+        ports (List[int]): The ports to check
+        timeout (float): Total time to wait for the connections (default: 0.5 seconds)
+
+    Returns:
+        List[int]: The reachable ports, in the order they were given
+    """
+    try:
+        addresses = _resolve(host)
+    except Exception:
+        return []
+
+    open_ports = set()
+    selector = selectors.DefaultSelector()
+
+    try:
+        for family, address in addresses:
+            for port in ports:
+                sock = None
+                try:
+                    sock = socket.socket(family, socket.SOCK_STREAM)
+                    sock.setblocking(False)
+                    result = sock.connect_ex((address, port))
+                except (OSError, OverflowError):
+                    # Unsupported address family or invalid port - skip it
+                    if sock is not None:
+                        sock.close()
+                    continue
+
+                if result == 0:
+                    open_ports.add(port)
+                    sock.close()
+                elif result in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN):
+                    selector.register(sock, selectors.EVENT_WRITE, port)
+                else:
+                    sock.close()
+
+        deadline = time.monotonic() + timeout
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            for key, _ in selector.select(remaining):
+                sock = key.fileobj
+                # The connect finished - SO_ERROR tells whether it succeeded
+                if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    open_ports.add(key.data)
+                selector.unregister(sock)
+                sock.close()
+    finally:
+        # Close the sockets that didn't connect within the timeout
+        for key in list(selector.get_map().values()):
+            selector.unregister(key.fileobj)
+            key.fileobj.close()
+        selector.close()
+
+    return [port for port in ports if port in open_ports]
+
+
+def verify_lemonade_server(port: int, host: str = "127.0.0.1", session: Optional[requests.Session] = None) -> bool:
     """
     Checks if a Lemonade server is running on the specified port.
 
@@ -40,19 +157,22 @@ def verify_lemonade_server(port: int, host: str = "127.0.0.1") -> bool:
     Args:
         port (int): The port to check
         host (str): The host (default: 127.0.0.1)
+        session (Optional[requests.Session]): Optional session (default: shared module session)
 
     Returns:
         bool: True if a Lemonade server is running on the port, otherwise False
     """
+    s = session or get_default_session()
+
     # Check 1: Native Lemonade API (definitive proof it's Lemonade, not Ollama)
     url = f"http://{host}:{port}/api/v1/models"
 
     try:
-        response = requests.get(url, timeout=2)
+        response = s.get(url, timeout=2)
         # A Lemonade server should respond to this endpoint with a list of models
         if response.status_code == 200:
             try:
-                data = response.json()
+                data = parse_json_response(response)
                 # Check if the response has the expected format
                 if "data" in data or isinstance(data, list):
                     return True
@@ -66,12 +186,12 @@ def verify_lemonade_server(port: int, host: str = "127.0.0.1") -> bool:
     # Lemonade may run on port 11434 with Ollama API simulation
     # Distinguish by checking Server header or alternative endpoints
     if port == 11434:
-        return _is_lemonade_on_ollama_port(host, port)
+        return _is_lemonade_on_ollama_port(host, port, session=s)
 
     return False
 
 
-def _is_lemonade_on_ollama_port(host: str = "127.0.0.1", port: int = 11434) -> bool:
+def _is_lemonade_on_ollama_port(host: str = "127.0.0.1", port: int = 11434, session: Optional[requests.Session] = None) -> bool:
     """
     Determines if a server on the Ollama-compatible port (11434) is actually Lemonade.
 
@@ -81,6 +201,7 @@ def _is_lemonade_on_ollama_port(host: str = "127.0.0.1", port: int = 11434) -> b
     Args:
         host (str): The host to check (default: 127.0.0.1)
         port (int): The port to check (default: 11434)
+        session (Optional[requests.Session]): Optional session (default: shared module session)
 
     Returns:
         bool: True if it's Lemonade, False if it's real Ollama or no server
@@ -89,7 +210,7 @@ def _is_lemonade_on_ollama_port(host: str = "127.0.0.1", port: int = 11434) -> b
     url = f"http://{host}:{port}/api/tags"  # Ollama-compatible endpoint
 
     try:
-        response = requests.get(url, timeout=2)
+        response = (session or get_default_session()).get(url, timeout=2)
         if response.status_code == 200:
             # Check Server header for "lemonade" identifier
             server_header = response.headers.get("Server", "").lower()
@@ -114,6 +235,94 @@ def _is_lemonade_on_ollama_port(host: str = "127.0.0.1", port: int = 11434) -> b
     return False
 
 
+def _probe_lemonade_server(host: str, port: int) -> bool:
+    """
+    Checks if the port is open and a Lemonade server answers on it.
+
+    Args:
+        host (str): The host to check
+        port (int): The port to check
+
+    Returns:
+        bool: True if a Lemonade server is running on the port, otherwise False
+    """
+    return is_port_open(host, port) and verify_lemonade_server(port, host)
+
+
+async def _probe(session, host: str, port: int, sem: asyncio.Semaphore) -> bool:
+    """
+    Async variant of _probe_lemonade_server() used by the aiohttp scanner.
+
+    Args:
+        session (aiohttp.ClientSession): Shared session for the HTTP checks
+        host (str): The host to check
+        port (int): The port to check
+        sem (asyncio.Semaphore): Limits the number of probes in flight
+
+    Returns:
+        bool: True if a Lemonade server is running on the port, otherwise False
+    """
+    async with sem:
+        # Equivalent of is_port_open()
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), 0.5)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+        # Equivalent of verify_lemonade_server()
+        url = f"http://{host}:{port}/api/v1/models"
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=2)) as response:
+                if response.status == 200:
+                    try:
+                        data = await response.json(content_type=None)
+                        if "data" in data or isinstance(data, list):
+                            return True
+                    except (ValueError, TypeError):
+                        pass
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+
+        if port == 11434:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, _is_lemonade_on_ollama_port, host, port)
+
+        return False
+
+
+async def _scan_targets_async(targets: List[tuple]) -> List[tuple]:
+    """
+    Probes all (host, port) pairs on a single event loop.
+
+    Args:
+        targets (List[tuple]): List of (host, port) tuples to probe
+
+    Returns:
+        List[tuple]: List of (host, port) tuples where Lemonade servers were found
+    """
+    sem = asyncio.Semaphore(20)
+    connector = aiohttp.TCPConnector(limit=64, limit_per_host=8)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(*[_probe(session, host, port, sem) for host, port in targets])
+
+    return [target for target, found in zip(targets, results) if found]
+
+
+def _in_running_loop() -> bool:
+    """Returns True if called from inside a running asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
 def find_available_lemonade_port(
     host: str = "127.0.0.1",
     ports: List[int] = None
@@ -131,12 +340,25 @@ def find_available_lemonade_port(
     if ports is None:
         ports = LEMONADE_DEFAULT_PORTS
 
-    for port in ports:
-        if is_port_open(host, port):
-            if verify_lemonade_server(port, host):
-                return port
+    # Find the open ports in one batch, then only verify those over HTTP
+    open_ports = scan_ports(host, ports)
+    if not open_ports:
+        return None
 
-    return None
+    # Verify concurrently, but keep the priority order of the port list
+    executor = ThreadPoolExecutor(max_workers=len(open_ports))
+    futures = [(port, executor.submit(verify_lemonade_server, port, host)) for port in open_ports]
+
+    try:
+        for port, future in futures:
+            if future.result():
+                return port
+        return None
+    finally:
+        # Don't wait for lower-priority probes once a server has been found
+        for _, future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
 
 
 def scan_multiple_hosts_for_lemonade(
@@ -146,6 +368,9 @@ def scan_multiple_hosts_for_lemonade(
     """
     Scans multiple hosts and ports for available Lemonade servers.
 
+    Uses asyncio + aiohttp when available (pip install aiohttp), otherwise
+    falls back to a thread pool. Both probe all pairs concurrently.
+
     Args:
         hosts (List[str]): List of hosts to scan
         ports (List[int]): List of ports to scan (default: [8000, 8020, 8040, 8060, 8080, 9000, 13305, 11434])
@@ -159,12 +384,14 @@ def scan_multiple_hosts_for_lemonade(
     if ports is None:
         ports = LEMONADE_DEFAULT_PORTS
 
-    available_servers = []
+    targets = [(host, port) for host in hosts for port in ports]
+    if not targets:
+        return []
 
-    for host in hosts:
-        for port in ports:
-            if is_port_open(host, port):
-                if verify_lemonade_server(port, host):
-                    available_servers.append((host, port))
+    # asyncio.run() can't be nested inside an already running event loop
+    if AIOHTTP_AVAILABLE and not _in_running_loop():
+        return asyncio.run(_scan_targets_async(targets))
 
-    return available_servers
\ No newline at end of file
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        results = executor.map(lambda target: _probe_lemonade_server(*target), targets)
+        return [target for target, found in zip(targets, results) if found]
@@ -4,7 +4,171 @@ Module for building API requests to the Lemonade server
 
 import requests
 import json
-from typing import Dict, Any, List, Optional
+import threading
+from typing import Dict, Any, Iterator, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson decodes straight from bytes and is considerably faster than the stdlib
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# httpx is an optional alternative HTTP backend (pip install httpx)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    httpx = None
+
+# HTTP/2 support in httpx needs the h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Exceptions raised by either HTTP backend, for use in except clauses
+if HTTPX_AVAILABLE:
+    HTTP_ERRORS = (requests.exceptions.HTTPError, httpx.HTTPStatusError)
+    REQUEST_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+else:
+    HTTP_ERRORS = (requests.exceptions.HTTPError,)
+    REQUEST_ERRORS = (requests.exceptions.RequestException,)
+
+
+def parse_json_response(response: requests.Response) -> Any:
+    """
+    Decodes the JSON body of a response, using orjson when it is installed.
+
+    Args:
+        response (requests.Response): The response to decode (requests or httpx)
+
+    Returns:
+        Any: The decoded JSON data
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON
+    """
+    return _json.loads(response.content)
+
+
+def create_session() -> requests.Session:
+    """
+    Creates a requests session tuned for talking to a Lemonade server.
+
+    The session keeps connections alive in a larger pool and retries
+    connection failures and transient 502/503/504 responses with back-off.
+    Read errors and timeouts are not retried, so a request the server has
+    already received (e.g. a chat completion) is never sent twice.
+
+    Returns:
+        requests.Session: The configured session
+    """
+    session = requests.Session()
+
+    retry = Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["GET", "POST"],
+        # Hand the last response back instead of raising RetryError,
+        # so callers still see the HTTP error from raise_for_status()
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # No default Content-Type here: JSON requests set it per call, and
+    # multipart uploads need requests to set it with the boundary
+    session.headers["Connection"] = "keep-alive"
+
+    return session
+
+
+def create_httpx_client(base_url: str) -> "httpx.Client":
+    """
+    Creates an httpx client as an alternative to create_session().
+
+    The client keeps up to 16 idle connections alive (32 in total), retries
+    failed connects and negotiates HTTP/2 when h2 is installed and the
+    server supports it.
+
+    Args:
+        base_url (str): The base URL of the Lemonade server
+
+    Returns:
+        httpx.Client: The configured client
+    """
+    limits = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+    transport = httpx.HTTPTransport(http2=HTTP2_AVAILABLE, limits=limits, retries=3)
+
+    # No default Content-Type here: json= sets it, and multipart uploads need their own
+    return httpx.Client(base_url=base_url, timeout=30, transport=transport)
+
+
+def is_httpx_client(session: Any) -> bool:
+    """
+    Checks whether a session object is an httpx client rather than a requests session.
+
+    Args:
+        session (Any): The session to check
+
+    Returns:
+        bool: True for an httpx.Client, otherwise False
+    """
+    return HTTPX_AVAILABLE and isinstance(session, httpx.Client)
+
+
+def open_stream(session: Any, method: str, url: str, **kwargs):
+    """
+    Starts a request whose body is read lazily, for either HTTP backend.
+
+    Args:
+        session (Any): A requests session or httpx client
+        method (str): HTTP method to use
+        url (str): The target URL for the request
+        **kwargs: Additional arguments for the request (json, headers, timeout)
+
+    Returns:
+        A context manager yielding the response
+    """
+    if is_httpx_client(session):
+        return session.stream(method, url, **kwargs)
+    return session.request(method, url, stream=True, **kwargs)
+
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_default_session() -> requests.Session:
+    """
+    Returns the module-wide session shared by the discovery and scanner functions.
+
+    The session is created on first use, so repeated probes reuse
+    keep-alive connections instead of opening a new one per call.
+
+    Returns:
+        requests.Session: The shared session
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = create_session()
+    return _SESSION
+
+
+# Optional sampling parameters passed through to chat completion requests
+_OPTIONAL_CHAT_PARAMS = frozenset({
+    "temperature", "top_p", "top_k", "max_tokens", "stop",
+    "presence_penalty", "frequency_penalty", "repetition_penalty"
+})
 
 
 def build_chat_completion_payload(model: str, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
@@ -19,22 +183,16 @@ def build_chat_completion_payload(model: str, messages: List[Dict[str, str]], **
     Returns:
         Dict[str, Any]: The finished payload for the request
     """
+    # Add optional parameters if they exist
+    extras = {key: value for key, value in kwargs.items() if key in _OPTIONAL_CHAT_PARAMS and value is not None}
+
     payload = {
         "model": model,
         "messages": messages,
         "stream": kwargs.get("stream", False),
+        **extras,
     }
 
-    # Add optional parameters if they exist
-    optional_params = [
-        "temperature", "top_p", "top_k", "max_tokens", "stop",
-        "presence_penalty", "frequency_penalty", "repetition_penalty"
-    ]
-
-    for param in optional_params:
-        if param in kwargs and kwargs[param] is not None:
-            payload[param] = kwargs[param]
-
     # Handle special parameters for Lemonade
     if "options" in kwargs:
         payload["options"] = kwargs["options"]
@@ -64,6 +222,26 @@ def build_model_load_payload(model_name: str, **kwargs) -> Dict[str, Any]:
     return payload
 
 
+def encode_json(payload: Any) -> bytes:
+    """
+    Encodes a payload as a JSON request body, using orjson when it is installed.
+
+    Args:
+        payload (Any): The data to encode
+
+    Returns:
+        bytes: The UTF-8 encoded JSON body
+    """
+    if _json is not json:
+        try:
+            # Accept non-str dict keys like json.dumps() does
+            return _json.dumps(payload, option=_json.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Anything else orjson rejects (e.g. integers > 64 bit) goes through the stdlib
+            pass
+    return json.dumps(payload).encode("utf-8")
+
+
 def send_request(url: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None, session: Optional[requests.Session] = None, method: str = "POST", timeout: int = 30) -> Dict[str, Any]:
     """
     Sends a request to the Lemonade server.
@@ -72,42 +250,146 @@ def send_request(url: str, payload: Dict[str, Any], headers: Optional[Dict[str,
         url (str): The target URL for the request
         payload (Dict[str, Any]): The payload to send
         headers (Optional[Dict[str, str]]): Optional headers for the request
-        session (Optional[requests.Session]): Optional session for the request
+        session (Optional[requests.Session]): Optional session for the request (requests or httpx)
         method (str): HTTP method to use ("POST" or "GET")
         timeout (int): Request timeout in seconds (default: 30)
 
     Returns:
         Dict[str, Any]: The response from the server
     """
+    if method.upper() == "POST":
+        return send_raw_request(url, encode_json(payload), headers=headers, session=session, timeout=timeout)
+
+    if method.upper() != "GET":
+        return {"error": f"Unsupported HTTP method: {method}"}
+
     if headers is None:
         headers = {
             "Content-Type": "application/json"
         }
 
-    # Use either the passed session or create a temporary one
-    req_session = session or requests.Session()
+    # Without a session, use the one-shot module-level requests API
+    req_session = session if session is not None else requests
+    response = None
 
     try:
-        if method.upper() == "POST":
-            response = req_session.post(url, json=payload, headers=headers, timeout=timeout)
-        elif method.upper() == "GET":
-            response = req_session.get(url, headers=headers, timeout=timeout, params=payload if payload else None)
+        response = req_session.get(url, headers=headers, timeout=timeout, params=payload if payload else None)
+        response.raise_for_status()
+        return parse_json_response(response)
+    except HTTP_ERRORS as e:
+        print(f"HTTP error in request to {url}: {e}")
+        if response is not None:
+            print(f"Response body: {response.text}")
+        return {"error": f"HTTP Error: {e}"}
+    except REQUEST_ERRORS as e:
+        print(f"Error in request to {url}: {e}")
+        return {"error": f"Request Error: {e}"}
+    except json.JSONDecodeError as e:
+        print(f"Error parsing response from {url}: {e}")
+        return {"error": f"JSON Decode Error: {e}"}
+
+
+def send_raw_request(url: str, body: bytes, headers: Optional[Dict[str, str]] = None, session: Optional[requests.Session] = None, timeout: int = 30) -> Dict[str, Any]:
+    """
+    POSTs an already encoded JSON body to the Lemonade server.
+
+    Encode the payload once with encode_json() and reuse the bytes when the
+    same request goes out many times or to several servers.
+
+    Args:
+        url (str): The target URL for the request
+        body (bytes): The JSON encoded request body
+        headers (Optional[Dict[str, str]]): Optional extra headers for the request
+        session (Optional[requests.Session]): Optional session for the request (requests or httpx)
+        timeout (int): Request timeout in seconds (default: 30)
+
+    Returns:
+        Dict[str, Any]: The response from the server
+    """
+    headers = {"Content-Type": "application/json", **(headers or {})}
+
+    # Without a session, use the one-shot module-level requests API
+    req_session = session if session is not None else requests
+    response = None
+
+    try:
+        if is_httpx_client(req_session):
+            response = req_session.post(url, content=body, headers=headers, timeout=timeout)
         else:
-            return {"error": f"Unsupported HTTP method: {method}"}
-        
+            response = req_session.post(url, data=body, headers=headers, timeout=timeout)
+
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.HTTPError as e:
+        return parse_json_response(response)
+    except HTTP_ERRORS as e:
         print(f"HTTP error in request to {url}: {e}")
         if response is not None:
             print(f"Response body: {response.text}")
         return {"error": f"HTTP Error: {e}"}
-    except requests.exceptions.RequestException as e:
+    except REQUEST_ERRORS as e:
         print(f"Error in request to {url}: {e}")
         return {"error": f"Request Error: {e}"}
     except json.JSONDecodeError as e:
         print(f"Error parsing response from {url}: {e}")
         return {"error": f"JSON Decode Error: {e}"}
+
+
+def send_stream_request(url: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None, session: Optional[requests.Session] = None, timeout: int = 30) -> Iterator[Dict[str, Any]]:
+    """
+    Sends a streaming request to the Lemonade server and yields the
+    Server-Sent Events chunks as they arrive.
+
+    Args:
+        url (str): The target URL for the request
+        payload (Dict[str, Any]): The payload to send (should contain "stream": True)
+        headers (Optional[Dict[str, str]]): Optional headers for the request
+        session (Optional[requests.Session]): Optional session for the request (requests or httpx)
+        timeout (int): Request timeout in seconds (default: 30)
+
+    Yields:
+        Dict[str, Any]: The decoded chunks, or a single {"error": ...} dict on failure
+    """
+    if headers is None:
+        headers = {
+            "Content-Type": "application/json"
+        }
+
+    # Use either the passed session or create a temporary one
+    req_session = session or requests.Session()
+    response = None
+
+    try:
+        with open_stream(req_session, "POST", url, json=payload, headers=headers, timeout=timeout) as response:
+            if response.status_code >= 400:
+                # Read the error body while the connection is still open
+                if is_httpx_client(req_session):
+                    response.read()
+                else:
+                    response.content
+            response.raise_for_status()
+
+            for line in response.iter_lines():
+                # httpx yields decoded lines, requests yields bytes
+                if isinstance(line, str):
+                    line = line.encode()
+                if not line.startswith(b"data: "):
+                    continue
+
+                data = line[6:]
+                if data.strip() == b"[DONE]":
+                    break
+
+                yield _json.loads(data)
+    except HTTP_ERRORS as e:
+        print(f"HTTP error in request to {url}: {e}")
+        if response is not None:
+            print(f"Response body: {response.text}")
+        yield {"error": f"HTTP Error: {e}"}
+    except REQUEST_ERRORS as e:
+        print(f"Error in request to {url}: {e}")
+        yield {"error": f"Request Error: {e}"}
+    except json.JSONDecodeError as e:
+        print(f"Error parsing response from {url}: {e}")
+        yield {"error": f"JSON Decode Error: {e}"}
     finally:
         # If no session was passed, close the temporary one here
         if session is None:
@@ -191,7 +473,7 @@ def send_multipart_request(
         files (Dict[str, Any]): Files to upload
         data (Optional[Dict[str, Any]]): Form data fields
         headers (Optional[Dict[str, str]]): Optional headers for the request
-        session (Optional[requests.Session]): Optional session for the request
+        session (Optional[requests.Session]): Optional session for the request (requests or httpx)
 
     Returns:
         Dict[str, Any]: The response from the server
@@ -206,13 +488,13 @@ def send_multipart_request(
     try:
         response = req_session.post(url, files=files, data=data, headers=headers, timeout=120)
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.HTTPError as e:
+        return parse_json_response(response)
+    except HTTP_ERRORS as e:
         print(f"HTTP error in request to {url}: {e}")
         if response is not None:
             print(f"Response body: {response.text}")
         return {"error": f"HTTP Error: {e}"}
-    except requests.exceptions.RequestException as e:
+    except REQUEST_ERRORS as e:
         print(f"Error in request to {url}: {e}")
         return {"error": f"Request Error: {e}"}
     except json.JSONDecodeError as e:
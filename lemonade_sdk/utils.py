@@ -5,11 +5,20 @@ Helper functions for Lemonade integration
 import json
 from typing import List, Dict, Any
 
+# Sentinel for dict lookups where None is a meaningful value
+_MISSING = object()
+
+# Character replacements applied by sanitize_model_name()
+_SANITIZE_TABLE = str.maketrans({" ": "_"})
+
 
 def format_messages_for_lemonade(messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
     """
     Formats messages in Lemonade-compatible format.
 
+    Messages that already consist of exactly 'role' and 'content' are
+    returned as-is, without copying the dicts.
+
     Args:
         messages (List[Dict[str, str]]): The messages to format
 
@@ -18,15 +27,11 @@ def format_messages_for_lemonade(messages: List[Dict[str, str]]) -> List[Dict[st
     """
     # Lemonade expects messages in OpenAI-like format
     # Ensure each message has a 'role' and 'content' field
-    formatted_messages = []
-    for msg in messages:
-        formatted_msg = {
-            "role": msg.get("role", "user"),
-            "content": msg.get("content", "")
-        }
-        formatted_messages.append(formatted_msg)
+    messages = list(messages)  # The input may be a one-shot iterator
+    if all(msg.keys() == {"role", "content"} for msg in messages):
+        return messages
 
-    return formatted_messages
+    return [{"role": msg.get("role", "user"), "content": msg.get("content", "")} for msg in messages]
 
 
 def extract_model_info_from_response(response: Dict[str, Any]) -> Dict[str, Any]:
@@ -76,14 +81,14 @@ def validate_lemonade_response(response: Dict[str, Any]) -> bool:
         return False
 
     # For chat completion responses, there should be choices
-    if "choices" in response:
-        if not isinstance(response["choices"], list) or len(response["choices"]) == 0:
-            return False
+    choices = response.get("choices", _MISSING)
+    if choices is not _MISSING and (not isinstance(choices, list) or not choices):
+        return False
 
     # For model list responses, there should be data
-    if "data" in response:
-        if not isinstance(response["data"], list):
-            return False
+    data = response.get("data", _MISSING)
+    if data is not _MISSING and not isinstance(data, list):
+        return False
 
     return True
 
@@ -98,11 +103,8 @@ def sanitize_model_name(model_name: str) -> str:
     Returns:
         str: The cleaned model name
     """
-    # Remove or replace invalid characters
-    sanitized = model_name.strip()
-    # Replace spaces with underscores if necessary
-    sanitized = sanitized.replace(" ", "_")
-    return sanitized
+    # Remove or replace invalid characters in a single pass
+    return model_name.strip().translate(_SANITIZE_TABLE)
 
 
 def format_error_message(error: Exception) -> str:
@@ -35,8 +35,18 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "requests>=2.25.0",
+        "urllib3>=1.26.0",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.8",
+        ],
+        "fast": [
+            "orjson>=3.0",
+        ],
+        "httpx": [
+            "httpx[http2]>=0.23",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov",